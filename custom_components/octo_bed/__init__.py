@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import OctoBedCoordinator
-from .services import async_setup_services
+from .services import async_forget_coordinator, async_setup_services
 
 PLATFORMS: list[Platform] = [
     Platform.COVER,
@@ -57,6 +57,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.async_create_task(coordinator.disconnect_held_connection())
 
     entry.async_on_unload(_unload_cleanup)
+    entry.async_on_unload(lambda: async_forget_coordinator(coordinator))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
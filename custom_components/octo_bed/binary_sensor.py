@@ -12,12 +12,23 @@ from .const import DOMAIN
 from .coordinator import OctoBedCoordinator
 from .entity import OctoBedEntity
 
+# Connection binary sensor attributes per connection_status (HA copies them into the state)
+_CONNECTION_ATTRS: dict[str, dict[str, str]] = {
+    "connected": {},
+    "searching": {"status": "searching for device"},
+    "pin_not_accepted": {"status": "PIN not accepted"},
+}
+_DISCONNECTED_ATTRS: dict[str, str] = {"status": "disconnected"}
+
 
 class OctoBedCalibrationActiveBinarySensor(OctoBedEntity, BinarySensorEntity):
     """Whether calibration is in progress (head or feet)."""
 
+    __slots__ = ()
+
     _attr_name = "Calibration active"
     _attr_unique_id = "calibration_active"
+    _always_available = True
     _attr_device_class = "running"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -25,37 +36,23 @@ class OctoBedCalibrationActiveBinarySensor(OctoBedEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         return self.coordinator.calibration_active
 
-    @property
-    def available(self) -> bool:
-        return True
-
 
 class OctoBedConnectionBinarySensor(OctoBedEntity, BinarySensorEntity):
     """On when the bed is authenticated: correct PIN accepted and commands work. Off when not authenticated or device not in range."""
 
+    __slots__ = ()
+
     _attr_name = "Connection status"
     _attr_unique_id = "connection_status"
     _attr_device_class = "connectivity"
 
     @property
     def is_on(self) -> bool:
-        return bool((self.coordinator.data or {}).get("connected"))
+        return self.coordinator.is_connected
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
-        data = self.coordinator.data or {}
-        status = data.get("connection_status", "disconnected")
-        if status == "connected":
-            return {}
-        if status == "searching":
-            return {"status": "searching for device"}
-        if status == "pin_not_accepted":
-            return {"status": "PIN not accepted"}
-        return {"status": "disconnected"}
-
-    @property
-    def available(self) -> bool:
-        return self.coordinator.device_address is not None
+        return _CONNECTION_ATTRS.get(self.coordinator.connection_status, _DISCONNECTED_ATTRS)
 
 
 async def async_setup_entry(
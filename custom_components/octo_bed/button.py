@@ -69,13 +69,14 @@ class OctoBedCalibrationStopButton(OctoBedEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         ok, head_sec, feet_sec = await self.coordinator.async_stop_calibration()
-        if ok and (head_sec is not None or feet_sec is not None):
-            opts = dict(self._entry.options)
+        entry = self._entry
+        if ok and entry is not None and (head_sec is not None or feet_sec is not None):
+            opts = dict(entry.options)
             if head_sec is not None:
                 opts[CONF_HEAD_CALIBRATION_SEC] = head_sec
             if feet_sec is not None:
                 opts[CONF_FEET_CALIBRATION_SEC] = feet_sec
-            self.hass.config_entries.async_update_entry(self._entry, options=opts)
+            self.hass.config_entries.async_update_entry(entry, options=opts)
         self.async_write_ha_state()
 
 
@@ -98,6 +98,12 @@ MOVEMENT_COMMAND_INTERVAL_SEC = 0.34
 KEEP_ALIVE_DELAY_SEC = 0.05
 # Delay after stop before movement (same connection)
 DELAY_AFTER_STOP_SAME_CONN_SEC = 0.1
+# Pause between phases of a "both" cover move (shortened by command_gap while the persistent connection is up)
+DELAY_BETWEEN_PHASES_SEC = 0.5
+# Pause before retrying a movement after a BLE error (not shortened: the link may be failing)
+DELAY_BEFORE_RETRY_SEC = 0.5
+# Skip re-checking that the configured address is seen by an adapter if it was confirmed this recently
+PRESENCE_CHECK_MIN_INTERVAL_SEC = 2.0
 # Debounce cover slider: wait for user to release before starting movement (prevents stuttering)
 COVER_DEBOUNCE_SEC = 0.35
 # Cooldown after movement: skip keep-alive so connection stays stable (device needs recovery time, like official app)
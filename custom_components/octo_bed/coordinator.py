@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Coroutine
 
 from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth, persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
@@ -20,6 +23,8 @@ from .const import (
     DELAY_AFTER_CONNECT_CALIBRATION_SEC,
     DELAY_AFTER_CONNECT_MOVEMENT_SEC,
     DELAY_AFTER_CONNECT_SEC,
+    DELAY_AFTER_STOP_SAME_CONN_SEC,
+    DELAY_BEFORE_RETRY_SEC,
     DOMAIN,
     CONF_DEVICE_NICKNAME,
     CONNECT_TIMEOUT,
@@ -49,6 +54,7 @@ from .const import (
     PIN_RESPONSE_REJECTED_1B,
     PIN_RESPONSE_REJECTED_ALT,
     PIN_RESPONSE_STATUS_BYTE_INDEX,
+    PRESENCE_CHECK_MIN_INTERVAL_SEC,
     WRITE_TIMEOUT,
 )
 
@@ -75,8 +81,25 @@ def _pin_to_digits(pin: str) -> bytes:
     )
 
 
+def _clamp_calibration_ms(ms: int) -> int:
+    """Clamp a full-travel calibration time to 1-120 s (in ms)."""
+    return 1000 if ms < 1000 else 120000 if ms > 120000 else ms
+
+
+def _at_limit(position: float) -> bool:
+    """True when a section sits at (or within 1%% of) an end stop. Positions are already clamped to 0-100."""
+    return position <= 1.0 or position >= 99.0
+
+
+# Which sections a movement command drives, and which commands move up
+_HEAD_COMMANDS = frozenset((CMD_HEAD_UP, CMD_HEAD_DOWN, CMD_BOTH_UP, CMD_BOTH_DOWN))
+_FEET_COMMANDS = frozenset((CMD_FEET_UP, CMD_FEET_DOWN, CMD_BOTH_UP, CMD_BOTH_DOWN))
+_UP_COMMANDS = frozenset((CMD_HEAD_UP, CMD_FEET_UP, CMD_BOTH_UP))
+
+
+@functools.lru_cache(maxsize=16)
 def _make_keep_alive(pin: str) -> bytes:
-    """Build keep-alive packet with 4-digit PIN."""
+    """Build keep-alive packet with 4-digit PIN (cached: sent every 30 s with the same PIN)."""
     return KEEP_ALIVE_PREFIX + _pin_to_digits(pin) + KEEP_ALIVE_SUFFIX
 
 
@@ -172,9 +195,18 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=60),
         )
         self._entry = entry
+        # Shared by all entities of this entry (built once, not per entity)
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="Octo Bed",
+            model="BLE Remote",
+        )
         _addr = entry.data.get(CONF_DEVICE_ADDRESS)
         self._device_address: str | None = (_addr and _addr.strip()) or None
         self._device_name = entry.data.get("device_name", "RC2")
+        # Normalized once; discovery compares every advertised name against it
+        self._device_name_folded = (self._device_name or "").strip().casefold()
         self._pin = _normalize_pin_str(entry.data.get("pin", "0000"))
         head_sec = entry.options.get("head_calibration_seconds", entry.data.get("head_calibration_seconds", DEFAULT_HEAD_CALIBRATION_SEC))
         feet_sec = entry.options.get("feet_calibration_seconds", entry.data.get("feet_calibration_seconds", DEFAULT_FEET_CALIBRATION_SEC))
@@ -184,11 +216,21 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Position state (persisted in options like YAML restore_value)
         self._head_position = float(entry.options.get("head_position", 0))
         self._feet_position = float(entry.options.get("feet_position", 0))
+        # Whole-percent positions for the covers, refreshed by the setters
+        self._head_position_int = int(round(self._head_position))
+        self._feet_position_int = int(round(self._feet_position))
+        self._both_position_int = int(round((self._head_position + self._feet_position) / 2.0))
         self._light_on = False
+        self._data_cache: dict[str, Any] = {}
         self._movement_active = False
+        # Open movement() blocks; while > 0 movement_active stays set between their phases
+        self._movement_holds = 0
         self._last_movement_end_time: float = 0.0
+        # True while movement commands are being written and no stop has been sent since
+        self._bed_is_moving = False
+        # Loop time when the configured address was last confirmed present (throttles the scanner lookup)
+        self._address_seen_at: float = 0.0
         self._cancel_discovery: Any = None
-        self._keep_alive_task: asyncio.Task[None] | None = None
         # Persistent connection (like YAML: connect once, keep open, send keep-alive every 30s)
         self._client: Any = None
         self._client_lock: asyncio.Lock = asyncio.Lock()
@@ -204,6 +246,14 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._calibration_notification_task: asyncio.Task[None] | None = None
         self._calibration_stopping = False
         self._active_cover_task: asyncio.Task[Any] | None = None
+        # Hold-to-move switches share one movement loop; only one command runs at a time
+        self._movement_task: asyncio.Task[tuple[float, bool]] | None = None
+        self._movement_cmd: bytes | None = None
+        self._movement_start_time: float = 0.0
+        # Serializes start/stop so overlapping turn-ons cannot leave an untracked movement task
+        self._movement_lock: asyncio.Lock = asyncio.Lock()
+        # Fire-and-forget tasks, referenced until they finish
+        self._bg_tasks: set[asyncio.Task[Any]] = set()
         self._movement_client: Any = None
         self._movement_client_disconnect_task: asyncio.Task[None] | None = None
         # Test scan: send pattern-based system commands with delay; Stop test scan cancels it
@@ -244,6 +294,19 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def feet_position(self) -> float:
         return self._feet_position
 
+    @property
+    def head_position_int(self) -> int:
+        return self._head_position_int
+
+    @property
+    def feet_position_int(self) -> int:
+        return self._feet_position_int
+
+    @property
+    def both_position_int(self) -> int:
+        """Average of head and feet, rounded to whole percent."""
+        return self._both_position_int
+
     @property
     def light_on(self) -> bool:
         return self._light_on
@@ -252,13 +315,21 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def movement_active(self) -> bool:
         return self._movement_active
 
+    def command_gap(self, base_sec: float) -> float:
+        """Pause to leave between BLE commands. The base gaps pad for a reconnect; on the open
+        persistent link the proxy already paces writes, so a tenth of it (never below the keep-alive
+        delay) is enough. Connection parameters can't be negotiated through the HA Bluetooth stack."""
+        if self._is_client_connected():
+            return max(KEEP_ALIVE_DELAY_SEC, base_sec / 10)
+        return base_sec
+
     @property
     def head_calibration_ms(self) -> int:
         sec = self._entry.options.get(
             "head_calibration_seconds",
             self._entry.data.get("head_calibration_seconds", DEFAULT_HEAD_CALIBRATION_SEC),
         )
-        return max(1000, min(120000, int(float(sec) * 1000)))
+        return _clamp_calibration_ms(int(float(sec) * 1000))
 
     @property
     def feet_calibration_ms(self) -> int:
@@ -266,17 +337,21 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "feet_calibration_seconds",
             self._entry.data.get("feet_calibration_seconds", DEFAULT_FEET_CALIBRATION_SEC),
         )
-        return max(1000, min(120000, int(float(sec) * 1000)))
+        return _clamp_calibration_ms(int(float(sec) * 1000))
 
     def set_head_position(self, value: float, *, persist: bool = True) -> None:
-        self._head_position = max(0.0, min(100.0, value))
+        self._head_position = 0.0 if value < 0.0 else 100.0 if value > 100.0 else value
+        self._head_position_int = int(round(self._head_position))
+        self._both_position_int = int(round((self._head_position + self._feet_position) / 2.0))
         if persist:
             self._persist_position()
         # Lightweight: push to entities without BLE check (avoids blocking during movement)
         self.async_set_updated_data(self._data())
 
     def set_feet_position(self, value: float, *, persist: bool = True) -> None:
-        self._feet_position = max(0.0, min(100.0, value))
+        self._feet_position = 0.0 if value < 0.0 else 100.0 if value > 100.0 else value
+        self._feet_position_int = int(round(self._feet_position))
+        self._both_position_int = int(round((self._head_position + self._feet_position) / 2.0))
         if persist:
             self._persist_position()
         self.async_set_updated_data(self._data())
@@ -290,13 +365,41 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def set_light_on(self, value: bool) -> None:
         self._light_on = value
+        self.async_set_updated_data(self._data())
 
     def set_movement_active(self, value: bool) -> None:
-        self._movement_active = value
+        self._movement_active = value or self._movement_holds > 0
+
+    @asynccontextmanager
+    async def movement(self) -> AsyncIterator[None]:
+        """Keep movement_active set across a multi-phase move (retries, both-cover phases).
+        If the move fails or is cancelled, send stop so the bed cannot keep going."""
+        self._movement_holds += 1
+        self._movement_active = True
+        try:
+            yield
+        except BaseException:
+            await self.async_send_stop()
+            raise
+        finally:
+            self._movement_holds -= 1
+            self.set_movement_active(False)
 
     def set_active_cover_task(self, task: asyncio.Task[Any] | None) -> None:
         self._active_cover_task = task
 
+    def clear_active_cover_task(self, task: asyncio.Task[Any]) -> None:
+        """Forget task if it is still the active cover task (a newer one may have replaced it)."""
+        if self._active_cover_task is task:
+            self._active_cover_task = None
+
+    def _create_bg_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        """Start a fire-and-forget task and keep a reference to it until it is done."""
+        task = self.hass.async_create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
     def cancel_active_cover_task(self) -> None:
         if self._active_cover_task and not self._active_cover_task.done():
             self._active_cover_task.cancel()
@@ -336,14 +439,26 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def set_calibration(self, head_sec: float | None = None, feet_sec: float | None = None) -> None:
         if head_sec is not None:
-            self._head_calibration_ms = max(1000, min(120000, int(head_sec * 1000)))
+            self._head_calibration_ms = _clamp_calibration_ms(int(head_sec * 1000))
         if feet_sec is not None:
-            self._feet_calibration_ms = max(1000, min(120000, int(feet_sec * 1000)))
+            self._feet_calibration_ms = _clamp_calibration_ms(int(feet_sec * 1000))
 
     @property
     def calibration_active(self) -> bool:
         return self._calibration_active
 
+    @property
+    def is_connected(self) -> bool:
+        """Connected flag from the last data push (what the entities report)."""
+        data = self.data
+        return data["connected"] if data else False
+
+    @property
+    def connection_status(self) -> str:
+        """connected / disconnected / pin_not_accepted / searching, from the last data push."""
+        data = self.data
+        return data["connection_status"] if data else "disconnected"
+
     def _address_present(self, addr: str | None) -> bool:
         """True if any adapter (including Bluetooth proxy) has seen this address."""
         if not addr:
@@ -372,27 +487,36 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             connection_status = "pin_not_accepted" if getattr(self, "_pin_rejected", False) else "disconnected"
         else:
             connection_status = "connected"
-        data: dict[str, Any] = {
-            "head_position": self._head_position,
-            "feet_position": self._feet_position,
-            "light_on": self._light_on,
-            "movement_active": self._movement_active,
-            "device_address": addr,
-            "available": addr is not None,
-            "connected": connected,
-            "connection_status": connection_status,
-            "calibration_active": self._calibration_active,
-        }
+        # One dict for the coordinator's lifetime, updated in place (listeners only read it)
+        data = self._data_cache
+        data["head_position"] = self._head_position
+        data["feet_position"] = self._feet_position
+        data["light_on"] = self._light_on
+        data["movement_active"] = self._movement_active
+        data["device_address"] = addr
+        data["available"] = addr is not None
+        data["connected"] = connected
+        data["connection_status"] = connection_status
+        data["calibration_active"] = self._calibration_active
         if self._calibration_active:
             elapsed = self.hass.loop.time() - self._calibration_start_time
             data["calibration_elapsed_sec"] = round(elapsed, 1)
             data["calibration_elapsed_formatted"] = _format_elapsed(elapsed)
             data["calibration_section"] = "head" if self._calibration_mode == 1 else "feet"
+        elif "calibration_section" in data:
+            del data["calibration_elapsed_sec"]
+            del data["calibration_elapsed_formatted"]
+            del data["calibration_section"]
         if self._last_device_notification_hex:
             data["last_device_notification"] = self._last_device_notification_hex
+        else:
+            data.pop("last_device_notification", None)
         if self._test_scan_total and self._test_scan_last_index:
             data["last_test_command"] = f"{self._test_scan_last_desc} ({self._test_scan_last_index}/{self._test_scan_total})"
             data["last_test_set_id"] = self._test_scan_set_id
+        elif "last_test_command" in data:
+            del data["last_test_command"]
+            del data["last_test_set_id"]
         return data
 
     async def _check_pin_accepted(self) -> bool:
@@ -618,7 +742,7 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         """Ensure we have a device address. Connection state comes from persistent connection – no periodic BLE check."""
         addr = self.device_address
-        if not addr:
+        if not addr and not self._movement_active:
             await self._async_ensure_address()
         data = self._data()
         _LOGGER.debug(
@@ -633,31 +757,29 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Resolve device address from config or discovery."""
         addr = self.device_address
         if addr:
+            # During movement the BLE client reports disconnects itself; no need to ask the scanner
+            now = self.hass.loop.time()
+            if self._movement_active or now - self._address_seen_at < PRESENCE_CHECK_MIN_INTERVAL_SEC:
+                return
             if self._address_present(addr):
+                self._address_seen_at = now
                 return
             _LOGGER.debug("Configured address %s not seen by any Bluetooth adapter", addr)
-        # Discover by name (check both connectable and non-connectable, e.g. proxy)
-        infos_conn = bluetooth.async_discovered_service_info(self.hass, connectable=True)
-        infos_any = bluetooth.async_discovered_service_info(self.hass, connectable=False)
-        seen_addrs: set[str] = set()
-        for info in infos_conn:
-            addr_key = (info.address or "").upper().replace(":", "")
-            if addr_key and addr_key not in seen_addrs:
-                seen_addrs.add(addr_key)
-                if info.name and self._device_name and info.name.strip().upper() == self._device_name.strip().upper():
-                    self._device_address = info.address
-                    self._persist_device_address(info.address)
-                    _LOGGER.info("Discovered Octo Bed remote at %s (name: %s)", info.address, info.name)
-                    return
-        for info in infos_any:
-            addr_key = (info.address or "").upper().replace(":", "")
-            if addr_key and addr_key not in seen_addrs:
-                seen_addrs.add(addr_key)
-                if info.name and self._device_name and info.name.strip().upper() == self._device_name.strip().upper():
-                    self._device_address = info.address
-                    self._persist_device_address(info.address)
-                    _LOGGER.info("Discovered Octo Bed remote at %s (name: %s)", info.address, info.name)
-                    return
+        # Discover by name in one pass over all adapters (connectable=False also lists connectable
+        # devices, e.g. proxy); a connectable match wins over a scanner-only one
+        name_folded = self._device_name_folded
+        if name_folded:
+            match = None
+            for info in bluetooth.async_discovered_service_info(self.hass, connectable=False):
+                if info.name and info.name.strip().casefold() == name_folded:
+                    match = info
+                    if info.connectable:
+                        break
+            if match is not None:
+                self._device_address = match.address
+                self._persist_device_address(match.address)
+                _LOGGER.info("Discovered Octo Bed remote at %s (name: %s)", match.address, match.name)
+                return
         _LOGGER.debug("No device named %s found; ensure remote is on and in range of Bluetooth Proxy", self._device_name)
 
     def _persist_device_address(self, address: str) -> None:
@@ -787,8 +909,9 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await _write_gatt_char_flexible(client, auth_cmd, response=False)
             await asyncio.sleep(KEEP_ALIVE_DELAY_SEC)
             await _write_gatt_char_flexible(client, CMD_STOP, response=False)
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(self.command_gap(0.1))
             await _write_gatt_char_flexible(client, CMD_STOP, response=False)
+            self._bed_is_moving = False
             _LOGGER.debug("Stop command sent (2x)")
             return True
         except Exception as e:
@@ -1011,20 +1134,36 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.set_head_position(self._head_position - delta_both)
             self.set_feet_position(self._feet_position - delta_both)
 
-    async def async_run_movement_loop(
-        self,
-        command: bytes,
-        is_cancelled: Callable[[], bool],
-    ) -> tuple[float, bool]:
-        """Send movement command every 340ms until cancelled or position limit reached. Uses persistent connection."""
+    def _movement_profile(self, command: bytes) -> tuple[bool, bool, float]:
+        """(moves head, moves feet, signed %% per second) for a movement command.
+        Both sections move at the pace of the slower calibration, as in the estimates below."""
+        moves_head = command in _HEAD_COMMANDS
+        moves_feet = command in _FEET_COMMANDS
+        if moves_head and moves_feet:
+            cal_ms = max(self.head_calibration_ms, self.feet_calibration_ms)
+        elif moves_head:
+            cal_ms = self.head_calibration_ms
+        else:
+            cal_ms = self.feet_calibration_ms
+        rate = 100.0 / max(0.1, cal_ms / 1000.0)
+        return moves_head, moves_feet, rate if command in _UP_COMMANDS else -rate
+
+    async def async_run_movement_loop(self, command: bytes) -> tuple[float, bool]:
+        """Send movement command every 340ms until the task is cancelled or position limit reached. Uses persistent connection.
+        Sends stop when it ends, so cancelling the task stops the bed right away."""
         self.set_movement_active(True)
         client = None
         start_time = self.hass.loop.time()
         start_head = self._head_position
         start_feet = self._feet_position
         hit_limit = False
-        head_cal_sec = self.head_calibration_ms / 1000.0
-        feet_cal_sec = self.feet_calibration_ms / 1000.0
+        # Estimate setup is fixed for the run; the loop only scales it by elapsed time
+        moves_head, moves_feet, rate = self._movement_profile(command)
+        going_up = rate > 0
+        limit = 100.0 if going_up else 0.0
+        # The section furthest from the end stop decides when the limit is reached
+        starts = [pos for pos, moves in ((start_head, moves_head), (start_feet, moves_feet)) if moves]
+        start_ref = (min(starts) if going_up else max(starts)) if starts else start_head
         try:
             if not await self._connection_check_before_movement():
                 self.set_movement_active(False)
@@ -1035,21 +1174,16 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if not client or not getattr(client, "is_connected", False):
                     self.set_movement_active(False)
                     return (0.0, False)
-            if command in (CMD_HEAD_UP, CMD_HEAD_DOWN):
-                at_extreme = self._head_position <= 1.0 or self._head_position >= 99.0
-            elif command in (CMD_FEET_UP, CMD_FEET_DOWN):
-                at_extreme = self._feet_position <= 1.0 or self._feet_position >= 99.0
-            else:
-                at_extreme = (
-                    (self._head_position <= 1.0 or self._head_position >= 99.0)
-                    or (self._feet_position <= 1.0 or self._feet_position >= 99.0)
-                )
+            at_extreme = (moves_head and _at_limit(self._head_position)) or (
+                moves_feet and _at_limit(self._feet_position)
+            )
             if at_extreme:
                 async with self._client_lock:
                     await _write_gatt_char_flexible(client, CMD_STOP, response=False)
-                await asyncio.sleep(0.1)
+                await asyncio.sleep(DELAY_AFTER_STOP_SAME_CONN_SEC)
+            self._bed_is_moving = True
             last_keep_alive = self.hass.loop.time()
-            while not is_cancelled():
+            while True:
                 now = self.hass.loop.time()
                 if now - last_keep_alive >= KEEP_ALIVE_INTERVAL_SEC:
                     async with self._client_lock:
@@ -1058,53 +1192,19 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         )
                     await asyncio.sleep(KEEP_ALIVE_DELAY_SEC)
                     last_keep_alive = now
-                elapsed = now - start_time
-                if command in (CMD_HEAD_UP, CMD_FEET_UP, CMD_BOTH_UP):
-                    if command == CMD_HEAD_UP:
-                        est = start_head + (elapsed / max(0.1, head_cal_sec)) * 100.0
-                        self.set_head_position(min(100.0, est), persist=False)
-                    elif command == CMD_FEET_UP:
-                        est = start_feet + (elapsed / max(0.1, feet_cal_sec)) * 100.0
-                        self.set_feet_position(min(100.0, est), persist=False)
-                    else:
-                        both_cal = max(head_cal_sec, feet_cal_sec)
-                        delta = (elapsed / max(0.1, both_cal)) * 100.0
-                        est = min(start_head + delta, start_feet + delta)
-                        self.set_head_position(min(100.0, start_head + delta), persist=False)
-                        self.set_feet_position(min(100.0, start_feet + delta), persist=False)
-                    if est >= 100.0:
-                        if command == CMD_HEAD_UP:
-                            self.set_head_position(100.0)
-                        elif command == CMD_FEET_UP:
-                            self.set_feet_position(100.0)
-                        else:
-                            self.set_head_position(100.0)
-                            self.set_feet_position(100.0)
-                        hit_limit = True
-                        break
-                else:
-                    if command == CMD_HEAD_DOWN:
-                        est = start_head - (elapsed / max(0.1, head_cal_sec)) * 100.0
-                        self.set_head_position(max(0.0, est), persist=False)
-                    elif command == CMD_FEET_DOWN:
-                        est = start_feet - (elapsed / max(0.1, feet_cal_sec)) * 100.0
-                        self.set_feet_position(max(0.0, est), persist=False)
-                    else:
-                        both_cal = max(head_cal_sec, feet_cal_sec)
-                        delta = (elapsed / max(0.1, both_cal)) * 100.0
-                        est = max(start_head - delta, start_feet - delta)
-                        self.set_head_position(max(0.0, start_head - delta), persist=False)
-                        self.set_feet_position(max(0.0, start_feet - delta), persist=False)
-                    if est <= 0.0:
-                        if command == CMD_HEAD_DOWN:
-                            self.set_head_position(0.0)
-                        elif command == CMD_FEET_DOWN:
-                            self.set_feet_position(0.0)
-                        else:
-                            self.set_head_position(0.0)
-                            self.set_feet_position(0.0)
-                        hit_limit = True
-                        break
+                delta = (now - start_time) * rate
+                if moves_head:
+                    self.set_head_position(start_head + delta, persist=False)
+                if moves_feet:
+                    self.set_feet_position(start_feet + delta, persist=False)
+                est = start_ref + delta
+                if (est >= 100.0) if going_up else (est <= 0.0):
+                    if moves_head:
+                        self.set_head_position(limit)
+                    if moves_feet:
+                        self.set_feet_position(limit)
+                    hit_limit = True
+                    break
                 async with self._client_lock:
                     await _write_gatt_char_flexible(client, command, response=False)
                 await asyncio.sleep(MOVEMENT_COMMAND_INTERVAL_SEC)
@@ -1116,11 +1216,78 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Movement loop BLE error: %s", e)
         finally:
             # Do NOT disconnect – keep persistent connection open
+            if self._bed_is_moving:
+                await self.async_send_stop()
+            self._bed_is_moving = False
             self.set_movement_active(False)
             self._last_movement_end_time = self.hass.loop.time()
         duration = self.hass.loop.time() - start_time
         return (duration, hit_limit)
 
+    @property
+    def active_cmd(self) -> bytes | None:
+        """Command of the running switch movement, or None."""
+        return self._movement_cmd
+
+    async def request_movement(self, command: bytes) -> None:
+        """Run command in the shared movement loop until stop_movement(). Replaces any other switch movement."""
+        async with self._movement_lock:
+            if self._movement_cmd == command:
+                return
+            # Listeners are told once below, with the new command already set
+            await self._end_movement()
+            self._movement_cmd = command
+            self._movement_start_time = self.hass.loop.time()
+            task = self.hass.async_create_task(self.async_run_movement_loop(command))
+            self._movement_task = task
+            task.add_done_callback(self._on_movement_task_done)
+        self.async_update_listeners()
+
+    def _on_movement_task_done(self, task: asyncio.Task[tuple[float, bool]]) -> None:
+        """Clear the switch movement once its loop ends (stopped, limit reached or BLE error)."""
+        if self._movement_task is not task:
+            return
+        self._movement_task = None
+        self._movement_cmd = None
+        self.async_update_listeners()
+
+    async def stop_movement(self, command: bytes | None = None) -> None:
+        """Stop the running switch movement and update the position estimate from how long it ran.
+        With command, only stop if that command is the one running. Checked under the lock, so a
+        turn-off that arrives while request_movement() is still replacing the old movement sees the new one."""
+        async with self._movement_lock:
+            if self._movement_task is None or (
+                command is not None and self._movement_cmd != command
+            ):
+                return
+            updated = await self._end_movement()
+        # A position update already notifies listeners; otherwise notify once here
+        if not updated:
+            self.async_update_listeners()
+
+    async def _end_movement(self) -> bool:
+        """Cancel the switch movement task and apply its position estimate. True if the position was updated."""
+        task = self._movement_task
+        if task is None:
+            return False
+        command = self._movement_cmd
+        # Cleared before awaiting so a second turn-off does not count the same run twice
+        self._movement_task = None
+        self._movement_cmd = None
+        duration = self.hass.loop.time() - self._movement_start_time
+        # Cancelling interrupts the loop between writes; it sends stop on the way out
+        task.cancel()
+        result = None
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            pass
+        hit_limit = result[1] if result is not None else False
+        if command is None or duration <= 0.1 or hit_limit:
+            return False
+        self.update_position_after_switch_movement(command, duration)
+        return True
+
     async def async_run_movement_for_duration(
         self, command: bytes, duration_sec: float
     ) -> bool:
@@ -1135,6 +1302,8 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         start_time: float = 0.0
         wait_start = self.hass.loop.time()
         max_wait_sec = 45.0
+        # Estimate setup is fixed for the run; the loop only scales it by elapsed time
+        moves_head, moves_feet, rate = self._movement_profile(command)
         try:
             for attempt in range(20):
                 remaining = duration_sec - elapsed_total
@@ -1157,27 +1326,18 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     continue
                 await asyncio.sleep(KEEP_ALIVE_DELAY_SEC)
                 try:
-                    if command in (CMD_HEAD_UP, CMD_HEAD_DOWN):
-                        at_extreme = self._head_position <= 1.0 or self._head_position >= 99.0
-                    elif command in (CMD_FEET_UP, CMD_FEET_DOWN):
-                        at_extreme = self._feet_position <= 1.0 or self._feet_position >= 99.0
-                    elif command in (CMD_BOTH_UP, CMD_BOTH_DOWN):
-                        at_extreme = (
-                            (self._head_position <= 1.0 or self._head_position >= 99.0)
-                            or (self._feet_position <= 1.0 or self._feet_position >= 99.0)
-                        )
-                    else:
-                        at_extreme = False
+                    at_extreme = (moves_head and _at_limit(self._head_position)) or (
+                        moves_feet and _at_limit(self._feet_position)
+                    )
                     if at_extreme:
                         async with self._client_lock:
                             await _write_gatt_char_flexible(client, CMD_STOP, response=False)
-                        await asyncio.sleep(0.1)
+                        await asyncio.sleep(DELAY_AFTER_STOP_SAME_CONN_SEC)
+                    self._bed_is_moving = True
                     start_time = self.hass.loop.time()
                     end_ts = start_time + remaining
                     start_head = self._head_position
                     start_feet = self._feet_position
-                    head_cal_sec = self.head_calibration_ms / 1000.0
-                    feet_cal_sec = self.feet_calibration_ms / 1000.0
                     last_keep_alive = start_time
                     while self.hass.loop.time() < end_ts:
                         now = self.hass.loop.time()
@@ -1191,32 +1351,13 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         async with self._client_lock:
                             await _write_gatt_char_flexible(client, command, response=False)
                         now = self.hass.loop.time()
-                        elapsed = now - start_time
-                        if command == CMD_HEAD_UP:
-                            est = start_head + (elapsed / max(0.1, head_cal_sec)) * 100.0
-                            self.set_head_position(min(100.0, est), persist=False)
-                        elif command == CMD_HEAD_DOWN:
-                            est = start_head - (elapsed / max(0.1, head_cal_sec)) * 100.0
-                            self.set_head_position(max(0.0, est), persist=False)
-                        elif command == CMD_FEET_UP:
-                            est = start_feet + (elapsed / max(0.1, feet_cal_sec)) * 100.0
-                            self.set_feet_position(min(100.0, est), persist=False)
-                        elif command == CMD_FEET_DOWN:
-                            est = start_feet - (elapsed / max(0.1, feet_cal_sec)) * 100.0
-                            self.set_feet_position(max(0.0, est), persist=False)
-                        elif command == CMD_BOTH_UP:
-                            both_cal = max(head_cal_sec, feet_cal_sec)
-                            delta = (elapsed / max(0.1, both_cal)) * 100.0
-                            est = start_head + delta
-                            self.set_head_position(min(100.0, start_head + delta), persist=False)
-                            self.set_feet_position(min(100.0, start_feet + delta), persist=False)
-                        elif command == CMD_BOTH_DOWN:
-                            both_cal = max(head_cal_sec, feet_cal_sec)
-                            delta = (elapsed / max(0.1, both_cal)) * 100.0
-                            est = start_head - delta
-                            self.set_head_position(max(0.0, start_head - delta), persist=False)
-                            self.set_feet_position(max(0.0, start_feet - delta), persist=False)
-                        await asyncio.sleep(MOVEMENT_COMMAND_INTERVAL_SEC)
+                        delta = (now - start_time) * rate
+                        if moves_head:
+                            self.set_head_position(start_head + delta, persist=False)
+                        if moves_feet:
+                            self.set_feet_position(start_feet + delta, persist=False)
+                        # The bed needs the command repeated, but don't sleep past the deadline
+                        await asyncio.sleep(min(MOVEMENT_COMMAND_INTERVAL_SEC, end_ts - now))
                     return True
                 except Exception as e:
                     elapsed_this_attempt = (
@@ -1236,12 +1377,13 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             100.0 * elapsed_total / duration_sec if duration_sec else 0,
                             e,
                         )
-                        await asyncio.sleep(0.5)
+                        await asyncio.sleep(DELAY_BEFORE_RETRY_SEC)
                         continue
                     _LOGGER.warning("Movement-for-duration BLE error: %s", e)
                     return False
         finally:
             # Do NOT disconnect – keep persistent connection open (like YAML)
+            self._bed_is_moving = False
             self.set_movement_active(False)
             self._last_movement_end_time = self.hass.loop.time()
 
@@ -1249,9 +1391,9 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Move head to 0-100%% (like cover set_position). Single BLE connection for smooth movement."""
         position = max(0.0, min(100.0, position))
         current = self._head_position
-        if abs(position - current) < 0.5:
-            return True
         diff = abs(position - current)
+        if diff < 0.5:
+            return True
         duration_ms = int((diff / 100.0) * self._head_calibration_ms)
         duration_ms = max(300, min(self._head_calibration_ms, duration_ms))
         duration_sec = duration_ms / 1000.0
@@ -1265,9 +1407,9 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Move feet to 0-100%% (like cover set_position). Single BLE connection for smooth movement."""
         position = max(0.0, min(100.0, position))
         current = self._feet_position
-        if abs(position - current) < 0.5:
-            return True
         diff = abs(position - current)
+        if diff < 0.5:
+            return True
         duration_ms = int((diff / 100.0) * self._feet_calibration_ms)
         duration_ms = max(300, min(self._feet_calibration_ms, duration_ms))
         duration_sec = duration_ms / 1000.0
@@ -1286,10 +1428,10 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             ok = await self._send_command(CMD_LIGHT_OFF)
             if ok:
-                await asyncio.sleep(0.2)
+                await asyncio.sleep(self.command_gap(0.2))
                 await self._send_command(CMD_LIGHT_OFF)
         if ok:
-            self._light_on = on
+            self.set_light_on(on)
         return ok
 
     async def async_send_keep_alive(self) -> bool:
@@ -1300,12 +1442,19 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self._connection_task is not None and not self._connection_task.done():
             return
         self._connection_stop.clear()
-        self._connection_task = self.hass.async_create_task(self._connection_loop())
+        # Background task: lives for the whole entry and must not hold up HA startup
+        self._connection_task = self.hass.async_create_background_task(
+            self._connection_loop(), f"{DOMAIN} connection {self._entry.entry_id}"
+        )
         _LOGGER.debug("Persistent connection loop started")
 
     def cancel_persistent_connection(self) -> None:
         """Stop connection loop and disconnect (call on integration unload)."""
         self._connection_stop.set()
+        if self._movement_task:
+            self._movement_task.cancel()
+            self._movement_task = None
+            self._movement_cmd = None
         if self._connection_task:
             self._connection_task.cancel()
             self._connection_task = None
@@ -1315,7 +1464,7 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._client = None
             await _safe_disconnect(client)
         try:
-            self.hass.async_create_task(_disconnect())
+            self._create_bg_task(_disconnect())
         except Exception:
             pass
 
@@ -1360,14 +1509,12 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         client, self._get_auth_command(), response=False
                     )
                 await asyncio.sleep(KEEP_ALIVE_DELAY_SEC)
-                at_extreme = (
-                    (self._head_position <= 1.0 or self._head_position >= 99.0)
-                    or (self._feet_position <= 1.0 or self._feet_position >= 99.0)
-                )
+                at_extreme = _at_limit(self._head_position) or _at_limit(self._feet_position)
                 if at_extreme:
                     async with self._client_lock:
                         await _write_gatt_char_flexible(client, CMD_STOP, response=False)
-                    await asyncio.sleep(0.1)
+                    await asyncio.sleep(DELAY_AFTER_STOP_SAME_CONN_SEC)
+                self._bed_is_moving = True
                 last_keep_alive = self.hass.loop.time()
                 while not stop_event.is_set():
                     now = self.hass.loop.time()
@@ -1499,13 +1646,15 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _on_calibration_task_done(self, task: asyncio.Task[None]) -> None:
         """When calibration task completes unexpectedly (e.g. BLE error), stop notification."""
+        # No more movement writes once the loop is gone; the bed halts without the 340ms repeat
+        self._bed_is_moving = False
         if not self._calibration_active or self._calibration_stopping:
             return
         # Task finished without user pressing stop – clean up
         self._calibration_active = False
         self._calibration_mode = 0
-        self.hass.async_create_task(self._stop_calibration_notification())
-        self.hass.async_create_task(self.async_request_refresh())
+        self._create_bg_task(self._stop_calibration_notification())
+        self._create_bg_task(self.async_request_refresh())
 
     async def async_stop_calibration(self) -> tuple[bool, float | None, float | None]:
         """Stop calibration, save elapsed time as 100%% duration, set position to 100%%, move calibrated section back to 0%%. Returns (ok, head_sec, feet_sec)."""
@@ -1531,7 +1680,7 @@ class OctoBedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await asyncio.sleep(0.5)
             head_sec = feet_sec = None
             duration_ms = int((self.hass.loop.time() - self._calibration_start_time) * 1000)
-            duration_ms = max(1000, min(120000, duration_ms))
+            duration_ms = _clamp_calibration_ms(duration_ms)
             if was_head:
                 head_sec = duration_ms / 1000.0
                 self._head_calibration_ms = duration_ms
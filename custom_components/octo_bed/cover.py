@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from abc import abstractmethod
+from typing import Any, Coroutine, Literal
 
 from homeassistant.components.cover import (
     ATTR_POSITION,
@@ -24,6 +25,8 @@ from .const import (
     CMD_HEAD_DOWN,
     CMD_HEAD_UP,
     COVER_DEBOUNCE_SEC,
+    DELAY_BEFORE_RETRY_SEC,
+    DELAY_BETWEEN_PHASES_SEC,
     DOMAIN,
 )
 from .coordinator import OctoBedCoordinator
@@ -35,6 +38,8 @@ _LOGGER = logging.getLogger(__name__)
 class OctoBedCoverEntity(OctoBedEntity, CoverEntity):
     """Base cover for Octo Bed."""
 
+    __slots__ = ()
+
     _attr_device_class = CoverDeviceClass.BLIND
     _attr_supported_features = (
         CoverEntityFeature.OPEN
@@ -46,73 +51,92 @@ class OctoBedCoverEntity(OctoBedEntity, CoverEntity):
     @property
     def current_cover_position(self) -> int | None:
         """Return current position 0-100."""
-        return int(round(self.coordinator.head_position))
+        return self.coordinator.head_position_int
 
     @property
     def is_closed(self) -> bool | None:
         return self.current_cover_position == 0
 
 
-class OctoBedHeadCoverEntity(OctoBedCoverEntity):
-    """Head section cover."""
+class _DebouncedCoverEntity(OctoBedCoverEntity):
+    """Slider debounce and movement-task handling shared by the cover entities.
 
-    _attr_name = "Head"
-    _attr_unique_id = "head_cover"
+    Subclasses implement _move_to(target), the coroutine that runs the movement."""
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+    __slots__ = (
+        "_debounce_timer",
+        "_pending_target",
+        "_debounce_deadline",
+        "_movement_task",
+    )
+
+    def __init__(self, coordinator: OctoBedCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
         self._debounce_timer: asyncio.TimerHandle | None = None
         self._pending_target: float | None = None
+        self._debounce_deadline = 0.0
         self._movement_task: asyncio.Task[None] | None = None
 
-    @property
-    def current_cover_position(self) -> int | None:
-        return int(round(self.coordinator.head_position))
+    @abstractmethod
+    def _move_to(self, target: float) -> Coroutine[Any, Any, None]:
+        """Return the coroutine that moves the cover to target (0-100)."""
+
+    def _schedule_run(self, target: float) -> None:
+        """Start the movement task and register it with the coordinator (Stop All cancels it)."""
+        task = self.hass.async_create_task(self._move_to(target))
+        task.add_done_callback(self._on_movement_done)
+        self._movement_task = task
+        self.coordinator.set_active_cover_task(task)
+
+    def _on_movement_done(self, task: asyncio.Task[None]) -> None:
+        # Identity check: a cancelled run can finish after its replacement was scheduled
+        if self._movement_task is task:
+            self._movement_task = None
+        self.coordinator.clear_active_cover_task(task)
 
     async def async_open_cover(self, **kwargs: Any) -> None:
-        _LOGGER.debug("Head cover: open (100%%)")
+        _LOGGER.debug("%s cover: open (100%%)", self._attr_name)
         self._cancel_debounce()
-        self._movement_task = self.hass.async_create_task(
-            self._run_to_position(100.0, is_head=True)
-        )
-        self.coordinator.set_active_cover_task(self._movement_task)
+        self._schedule_run(100.0)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
-        _LOGGER.debug("Head cover: close (0%%)")
+        _LOGGER.debug("%s cover: close (0%%)", self._attr_name)
         self._cancel_debounce()
-        self._movement_task = self.hass.async_create_task(
-            self._run_to_position(0.0, is_head=True)
-        )
-        self.coordinator.set_active_cover_task(self._movement_task)
+        self._schedule_run(0.0)
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
-        _LOGGER.debug("Head cover: stop")
+        _LOGGER.debug("%s cover: stop", self._attr_name)
         self._cancel_debounce()
-        if self._movement_task and not self._movement_task.done():
-            self._movement_task.cancel()
-        self.coordinator.set_movement_active(False)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         position = kwargs.get(ATTR_POSITION)
         if position is None:
             return
         target = float(position)
-        self._cancel_debounce()
+        loop = self.hass.loop
+        if self._debounce_timer is None:
+            # First event of a slider drag: stop any running move and arm one timer for the drag
+            self._cancel_debounce()
+            self._debounce_timer = loop.call_later(
+                COVER_DEBOUNCE_SEC, self._on_debounce_fire
+            )
+        # Later events only push the deadline out; the timer re-arms itself when it fires early
         self._pending_target = target
-        self._debounce_timer = self.hass.loop.call_later(
-            COVER_DEBOUNCE_SEC, self._debounce_timer_fired_head
-        )
+        self._debounce_deadline = loop.time() + COVER_DEBOUNCE_SEC
 
-    def _debounce_timer_fired_head(self) -> None:
+    def _on_debounce_fire(self) -> None:
+        remaining = self._debounce_deadline - self.hass.loop.time()
+        if remaining > 0:
+            self._debounce_timer = self.hass.loop.call_later(
+                remaining, self._on_debounce_fire
+            )
+            return
         self._debounce_timer = None
         target = self._pending_target
         self._pending_target = None
         if target is not None:
-            _LOGGER.debug("Head cover: debounce fired, moving to %.0f%%", target)
-            self._movement_task = self.hass.async_create_task(
-                self._run_to_position(target, is_head=True)
-            )
-            self.coordinator.set_active_cover_task(self._movement_task)
+            _LOGGER.debug("%s cover: debounce fired, moving to %.0f%%", self._attr_name, target)
+            self._schedule_run(target)
 
     def _cancel_debounce(self) -> None:
         if self._debounce_timer:
@@ -126,253 +150,149 @@ class OctoBedHeadCoverEntity(OctoBedCoverEntity):
         self._cancel_debounce()
         await super().async_will_remove_from_hass()
 
-    async def _run_to_position(self, target: float, is_head: bool) -> None:
-        """Run head or feet to target 0-100. No pre-delays – connect and send movement until target/limit.
-        Retries once on BLE failure. Keeps movement_active=True so coordinator skips BLE checks."""
-        section = "head" if is_head else "feet"
-        _LOGGER.debug("%s: movement starting to %.0f%%", section.capitalize(), target)
-        coordinator = self.coordinator
-        coordinator.set_movement_active(True)
-        try:
-            for attempt in range(2):
-                if is_head:
-                    current = coordinator.head_position
-                    cal_ms = coordinator.head_calibration_ms
-                    command = CMD_HEAD_UP if target > current else CMD_HEAD_DOWN
-                    set_pos = coordinator.set_head_position
-                else:
-                    current = coordinator.feet_position
-                    cal_ms = coordinator.feet_calibration_ms
-                    command = CMD_FEET_UP if target > current else CMD_FEET_DOWN
-                    set_pos = coordinator.set_feet_position
-                diff = abs(target - current)
-                if diff < 0.5:
-                    return
-                duration_ms = int((diff / 100.0) * cal_ms)
-                duration_ms = max(300, min(cal_ms, duration_ms))
-                duration_sec = duration_ms / 1000.0
-                ok = await coordinator.async_run_movement_for_duration(
-                    command, duration_sec
-                )
-                if ok:
-                    set_pos(target)
-                    break
-                if attempt == 0:
-                    await asyncio.sleep(0.5)
-            self.async_write_ha_state()
-        finally:
-            self._movement_task = None
-            coordinator.set_active_cover_task(None)
-            coordinator.set_movement_active(False)
 
+class OctoBedSingleAxisCoverEntity(_DebouncedCoverEntity):
+    """Head or feet section cover. Subclasses set _axis, name and unique_id."""
 
-class OctoBedFeetCoverEntity(OctoBedCoverEntity):
-    """Feet section cover."""
+    __slots__ = ("_get_pos", "_get_pos_int", "_set_pos", "_cmd_up", "_cmd_down")
 
-    _attr_name = "Feet"
-    _attr_unique_id = "feet_cover"
+    _axis: Literal["head", "feet"]
+    # (up, down) movement command per section
+    _COMMANDS: dict[str, tuple[bytes, bytes]] = {
+        "head": (CMD_HEAD_UP, CMD_HEAD_DOWN),
+        "feet": (CMD_FEET_UP, CMD_FEET_DOWN),
+    }
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        self._debounce_timer: asyncio.TimerHandle | None = None
-        self._pending_target: float | None = None
-        self._movement_task: asyncio.Task[None] | None = None
+    def __init__(self, coordinator: OctoBedCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        axis = self._axis
+        self._get_pos = getattr(OctoBedCoordinator, f"{axis}_position").fget
+        self._get_pos_int = getattr(OctoBedCoordinator, f"{axis}_position_int").fget
+        self._set_pos = getattr(coordinator, f"set_{axis}_position")
+        self._cmd_up, self._cmd_down = self._COMMANDS[axis]
 
     @property
     def current_cover_position(self) -> int | None:
-        return int(round(self.coordinator.feet_position))
+        return self._get_pos_int(self.coordinator)
 
-    async def async_open_cover(self, **kwargs: Any) -> None:
-        self._cancel_debounce()
-        self._movement_task = self.hass.async_create_task(
-            self._run_to_position(100.0, is_head=False)
-        )
-        self.coordinator.set_active_cover_task(self._movement_task)
-
-    async def async_close_cover(self, **kwargs: Any) -> None:
-        self._cancel_debounce()
-        self._movement_task = self.hass.async_create_task(
-            self._run_to_position(0.0, is_head=False)
-        )
-        self.coordinator.set_active_cover_task(self._movement_task)
-
-    async def async_stop_cover(self, **kwargs: Any) -> None:
-        self._cancel_debounce()
-        if self._movement_task and not self._movement_task.done():
-            self._movement_task.cancel()
-        self.coordinator.set_movement_active(False)
-
-    async def async_set_cover_position(self, **kwargs: Any) -> None:
-        position = kwargs.get(ATTR_POSITION)
-        if position is None:
-            return
-        target = float(position)
-        self._cancel_debounce()
-        self._pending_target = target
-        self._debounce_timer = self.hass.loop.call_later(
-            COVER_DEBOUNCE_SEC, self._debounce_timer_fired_feet
-        )
+    def _move_to(self, target: float) -> Coroutine[Any, Any, None]:
+        return self._run_to_position(target)
 
-    def _debounce_timer_fired_feet(self) -> None:
-        self._debounce_timer = None
-        target = self._pending_target
-        self._pending_target = None
-        if target is not None:
-            self._movement_task = self.hass.async_create_task(
-                self._run_to_position(target, is_head=False)
-            )
-            self.coordinator.set_active_cover_task(self._movement_task)
+    def _calibration_ms(self) -> int:
+        if self._axis == "head":
+            return self.coordinator.head_calibration_ms
+        return self.coordinator.feet_calibration_ms
 
-    def _cancel_debounce(self) -> None:
-        if self._debounce_timer:
-            self._debounce_timer.cancel()
-            self._debounce_timer = None
-        self._pending_target = None
-        if self._movement_task and not self._movement_task.done():
-            self._movement_task.cancel()
-
-    async def async_will_remove_from_hass(self) -> None:
-        self._cancel_debounce()
-        await super().async_will_remove_from_hass()
-
-    async def _run_to_position(self, target: float, is_head: bool) -> None:
-        """Run feet to target. No pre-delays – connect and send movement until target/limit.
-        Retries once on BLE failure. Keeps movement_active=True so coordinator skips BLE checks."""
+    async def _run_to_position(self, target: float) -> None:
+        """Run this section to target 0-100. No pre-delays – connect and send movement until target/limit.
+        Retries once on BLE failure. coordinator.movement() holds movement_active and stops the bed on failure."""
+        _LOGGER.debug("%s: movement starting to %.0f%%", self._attr_name, target)
         coordinator = self.coordinator
-        coordinator.set_movement_active(True)
-        try:
+        async with coordinator.movement():
+            # Calibration doesn't change between attempts
+            cal_ms = self._calibration_ms()
+            current = self._get_pos(coordinator)
             for attempt in range(2):
-                current = coordinator.feet_position
-                cal_ms = coordinator.feet_calibration_ms
                 diff = abs(target - current)
                 if diff < 0.5:
-                    return
+                    # Nothing to do (or a failed first attempt already got close enough)
+                    break
                 duration_ms = int((diff / 100.0) * cal_ms)
                 duration_ms = max(300, min(cal_ms, duration_ms))
                 duration_sec = duration_ms / 1000.0
-                command = CMD_FEET_UP if target > current else CMD_FEET_DOWN
+                command = self._cmd_up if target > current else self._cmd_down
                 ok = await coordinator.async_run_movement_for_duration(
                     command, duration_sec
                 )
                 if ok:
-                    coordinator.set_feet_position(target)
+                    self._set_pos(target)
                     break
+                # A failed run may have moved part of the way (estimate is updated while moving)
+                current = self._get_pos(coordinator)
                 if attempt == 0:
-                    await asyncio.sleep(0.5)
-            self.async_write_ha_state()
-        finally:
-            self._movement_task = None
-            coordinator.set_active_cover_task(None)
-            coordinator.set_movement_active(False)
+                    await asyncio.sleep(DELAY_BEFORE_RETRY_SEC)
 
 
-class OctoBedBothCoverEntity(OctoBedCoverEntity):
-    """Both sections cover (moves head and feet together)."""
+class OctoBedHeadCoverEntity(OctoBedSingleAxisCoverEntity):
+    """Head section cover."""
 
-    _attr_name = "Both"
-    _attr_unique_id = "both_cover"
+    __slots__ = ()
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        self._debounce_timer: asyncio.TimerHandle | None = None
-        self._pending_target: float | None = None
-        self._movement_task: asyncio.Task[None] | None = None
+    _axis = "head"
+    _attr_name = "Head"
+    _attr_unique_id = "head_cover"
 
-    @property
-    def current_cover_position(self) -> int | None:
-        h = self.coordinator.head_position
-        f = self.coordinator.feet_position
-        return int(round((h + f) / 2.0))
 
-    async def async_open_cover(self, **kwargs: Any) -> None:
-        self._cancel_debounce()
-        self._movement_task = self.hass.async_create_task(
-            self._run_both_to_position(100.0)
-        )
-        self.coordinator.set_active_cover_task(self._movement_task)
+class OctoBedFeetCoverEntity(OctoBedSingleAxisCoverEntity):
+    """Feet section cover."""
 
-    async def async_close_cover(self, **kwargs: Any) -> None:
-        self._cancel_debounce()
-        self._movement_task = self.hass.async_create_task(
-            self._run_both_to_position(0.0)
-        )
-        self.coordinator.set_active_cover_task(self._movement_task)
+    __slots__ = ()
 
-    async def async_stop_cover(self, **kwargs: Any) -> None:
-        self._cancel_debounce()
-        if self._movement_task and not self._movement_task.done():
-            self._movement_task.cancel()
-        self.coordinator.set_movement_active(False)
+    _axis = "feet"
+    _attr_name = "Feet"
+    _attr_unique_id = "feet_cover"
 
-    async def async_set_cover_position(self, **kwargs: Any) -> None:
-        position = kwargs.get(ATTR_POSITION)
-        if position is None:
-            return
-        target = float(position)
-        self._cancel_debounce()
-        self._pending_target = target
-        self._debounce_timer = self.hass.loop.call_later(
-            COVER_DEBOUNCE_SEC, self._debounce_timer_fired_both
-        )
 
-    def _debounce_timer_fired_both(self) -> None:
-        self._debounce_timer = None
-        target = self._pending_target
-        self._pending_target = None
-        if target is not None:
-            self._movement_task = self.hass.async_create_task(
-                self._run_both_to_position(target)
-            )
-            self.coordinator.set_active_cover_task(self._movement_task)
+class OctoBedBothCoverEntity(_DebouncedCoverEntity):
+    """Both sections cover (moves head and feet together)."""
 
-    def _cancel_debounce(self) -> None:
-        if self._debounce_timer:
-            self._debounce_timer.cancel()
-            self._debounce_timer = None
-        self._pending_target = None
-        if self._movement_task and not self._movement_task.done():
-            self._movement_task.cancel()
+    __slots__ = ()
 
-    async def async_will_remove_from_hass(self) -> None:
-        self._cancel_debounce()
-        await super().async_will_remove_from_hass()
+    _attr_name = "Both"
+    _attr_unique_id = "both_cover"
+
+    @property
+    def current_cover_position(self) -> int | None:
+        return self.coordinator.both_position_int
+
+    def _move_to(self, target: float) -> Coroutine[Any, Any, None]:
+        return self._run_both_to_position(target)
+
+    async def _phase_gap(self) -> None:
+        """Pause between movement phases. The long gap only matters when each phase has to reconnect."""
+        await asyncio.sleep(self.coordinator.command_gap(DELAY_BETWEEN_PHASES_SEC))
 
     async def _run_both_to_position(self, target: float) -> None:
         """Move both sections to target. No pre-delays – connect and send movement until target/limit.
         Same direction: phase 1 = both_up/down until faster section done; phase 2 = head or feet only.
         Different directions: sequential head then feet. Retries once on BLE failure."""
         coordinator = self.coordinator
-        coordinator.set_movement_active(True)
-        try:
+        async with coordinator.movement():
             for attempt in range(2):
                 head_current = coordinator.head_position
                 feet_current = coordinator.feet_position
                 head_diff = abs(target - head_current)
                 feet_diff = abs(target - feet_current)
-                head_duration_sec = (head_diff / 100.0) * (coordinator.head_calibration_ms / 1000.0) if head_diff >= 0.5 else 0.0
-                feet_duration_sec = (feet_diff / 100.0) * (coordinator.feet_calibration_ms / 1000.0) if feet_diff >= 0.5 else 0.0
-                head_duration_sec = max(0.3, head_duration_sec)
-                feet_duration_sec = max(0.3, feet_duration_sec)
+                if head_diff < 0.5 and feet_diff < 0.5:
+                    # Already there; the 300 ms minimum below would otherwise still nudge the bed
+                    break
+                # Durations in integer ms (the calibration unit); diff scaled by 10 keeps 0.1% steps
+                head_cal_ms = coordinator.head_calibration_ms
+                feet_cal_ms = coordinator.feet_calibration_ms
+                head_ms = (int(head_diff * 10) * head_cal_ms) // 1000 if head_diff >= 0.5 else 0
+                feet_ms = (int(feet_diff * 10) * feet_cal_ms) // 1000 if feet_diff >= 0.5 else 0
+                head_ms = max(300, min(head_cal_ms, head_ms))
+                feet_ms = max(300, min(feet_cal_ms, feet_ms))
                 all_ok = True
                 if target > head_current and target > feet_current:
-                    phase1 = min(head_duration_sec, feet_duration_sec)
+                    phase1_ms = min(head_ms, feet_ms)
                     ok = await coordinator.async_run_movement_for_duration(
-                        CMD_BOTH_UP, phase1
+                        CMD_BOTH_UP, phase1_ms / 1000
                     )
                     if not ok:
                         all_ok = False
                     else:
-                        head_remaining = head_duration_sec - phase1
-                        feet_remaining = feet_duration_sec - phase1
-                        if head_remaining > 0.1:
-                            await asyncio.sleep(0.5)
+                        head_remaining_ms = head_ms - phase1_ms
+                        feet_remaining_ms = feet_ms - phase1_ms
+                        if head_remaining_ms > 100:
+                            await self._phase_gap()
                             ok = await coordinator.async_run_movement_for_duration(
-                                CMD_HEAD_UP, head_remaining
+                                CMD_HEAD_UP, head_remaining_ms / 1000
                             )
-                        elif feet_remaining > 0.1:
-                            await asyncio.sleep(0.5)
+                        elif feet_remaining_ms > 100:
+                            await self._phase_gap()
                             ok = await coordinator.async_run_movement_for_duration(
-                                CMD_FEET_UP, feet_remaining
+                                CMD_FEET_UP, feet_remaining_ms / 1000
                             )
                         else:
                             ok = True
@@ -382,24 +302,24 @@ class OctoBedBothCoverEntity(OctoBedCoverEntity):
                         else:
                             all_ok = False
                 elif target < head_current and target < feet_current:
-                    phase1 = min(head_duration_sec, feet_duration_sec)
+                    phase1_ms = min(head_ms, feet_ms)
                     ok = await coordinator.async_run_movement_for_duration(
-                        CMD_BOTH_DOWN, phase1
+                        CMD_BOTH_DOWN, phase1_ms / 1000
                     )
                     if not ok:
                         all_ok = False
                     else:
-                        head_remaining = head_duration_sec - phase1
-                        feet_remaining = feet_duration_sec - phase1
-                        if head_remaining > 0.1:
-                            await asyncio.sleep(0.5)
+                        head_remaining_ms = head_ms - phase1_ms
+                        feet_remaining_ms = feet_ms - phase1_ms
+                        if head_remaining_ms > 100:
+                            await self._phase_gap()
                             ok = await coordinator.async_run_movement_for_duration(
-                                CMD_HEAD_DOWN, head_remaining
+                                CMD_HEAD_DOWN, head_remaining_ms / 1000
                             )
-                        elif feet_remaining > 0.1:
-                            await asyncio.sleep(0.5)
+                        elif feet_remaining_ms > 100:
+                            await self._phase_gap()
                             ok = await coordinator.async_run_movement_for_duration(
-                                CMD_FEET_DOWN, feet_remaining
+                                CMD_FEET_DOWN, feet_remaining_ms / 1000
                             )
                         else:
                             ok = True
@@ -409,35 +329,26 @@ class OctoBedBothCoverEntity(OctoBedCoverEntity):
                         else:
                             all_ok = False
                 else:
+                    # Opposite directions: the bed has no combined command for this and interleaving
+                    # head/feet writes would make both sections stutter, so run them back to back
+                    moves: list[tuple[bytes, int]] = []
                     if head_diff >= 0.5:
-                        cmd = CMD_HEAD_UP if target > head_current else CMD_HEAD_DOWN
-                        head_ok = await coordinator.async_run_movement_for_duration(
-                            cmd, head_duration_sec
-                        )
-                    else:
-                        head_ok = True
+                        moves.append((CMD_HEAD_UP if target > head_current else CMD_HEAD_DOWN, head_ms))
                     if feet_diff >= 0.5:
-                        await asyncio.sleep(0.5)
-                        cmd = CMD_FEET_UP if target > feet_current else CMD_FEET_DOWN
-                        feet_ok = await coordinator.async_run_movement_for_duration(
-                            cmd, feet_duration_sec
-                        )
-                    else:
-                        feet_ok = True
-                    if head_ok and feet_ok:
+                        moves.append((CMD_FEET_UP if target > feet_current else CMD_FEET_DOWN, feet_ms))
+                    for index, (cmd, ms) in enumerate(moves):
+                        if index:
+                            await self._phase_gap()
+                        if not await coordinator.async_run_movement_for_duration(cmd, ms / 1000):
+                            all_ok = False
+                            break
+                    if all_ok:
                         coordinator.set_head_position(target)
                         coordinator.set_feet_position(target)
-                    else:
-                        all_ok = False
-                if all_ok or (head_diff < 0.5 and feet_diff < 0.5):
+                if all_ok:
                     break
                 if attempt == 0:
-                    await asyncio.sleep(0.5)
-            self.async_write_ha_state()
-        finally:
-            self._movement_task = None
-            coordinator.set_active_cover_task(None)
-            coordinator.set_movement_active(False)
+                    await asyncio.sleep(DELAY_BEFORE_RETRY_SEC)
 
 
 async def async_setup_entry(
@@ -3,34 +3,48 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import OctoBedCoordinator
 
 
 class OctoBedEntity(CoordinatorEntity[OctoBedCoordinator], Entity):
     """Base class for Octo Bed entities."""
 
+    __slots__ = ("_entry_id",)
+
+    # Diagnostic/position entities that stay available even before a device address is known
+    _always_available = False
+
     def __init__(self, coordinator: OctoBedCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
-        self._entry = entry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.title,
-            manufacturer="Octo Bed",
-            model="BLE Remote",
-        )
+        # Only the id: HA keeps the entry itself; look it up when needed (cold path)
+        self._entry_id = entry.entry_id
+        self._attr_device_info = coordinator.device_info
         # Ensure unique_id is scoped to this config entry (avoids duplicates with multiple beds)
         if getattr(self, "_attr_unique_id", None) and not str(
             self._attr_unique_id
         ).startswith(entry.entry_id):
             self._attr_unique_id = f"{entry.entry_id}_{self._attr_unique_id}"
+        if not self._always_available:
+            self._attr_available = coordinator.device_address is not None
+
+    @property
+    def _entry(self) -> ConfigEntry | None:
+        return self.hass.config_entries.async_get_entry(self._entry_id)
 
     @property
     def available(self) -> bool:
         # Never show unavailable when we have a device address – bed must not "disconnect" from addon.
         # BLE/proxy can report device as unavailable briefly after we close a connection (e.g. at 100%);
         # that is not a real disconnect and should not make entities unavailable.
-        return self.coordinator.device_address is not None
+        # Kept in _attr_available, refreshed on coordinator updates (not recomputed per state read).
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if not self._always_available:
+            self._attr_available = self.coordinator.device_address is not None
+        super()._handle_coordinator_update()
@@ -25,16 +25,11 @@ class OctoBedLightEntity(OctoBedEntity, LightEntity):
         return self.coordinator.light_on
 
     async def async_turn_on(self, **kwargs) -> None:
-        ok = await self.coordinator.async_set_light(True)
-        if ok:
-            self.coordinator.set_light_on(True)
-            self.async_write_ha_state()
+        # The coordinator notifies its listeners (including this entity) when the light changes
+        await self.coordinator.async_set_light(True)
 
     async def async_turn_off(self, **kwargs) -> None:
-        ok = await self.coordinator.async_set_light(False)
-        if ok:
-            self.coordinator.set_light_on(False)
-            self.async_write_ha_state()
+        await self.coordinator.async_set_light(False)
 
 
 async def async_setup_entry(
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
+from typing import Any, Literal
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -12,99 +15,105 @@ from .const import DOMAIN
 from .coordinator import OctoBedCoordinator
 from .entity import OctoBedEntity
 
+_NOT_SET = "Not set"
+# Coordinator data keys only present while there is something to report
+_OPTIONAL_STATUS_KEYS = ("last_device_notification", "last_test_command", "last_test_set_id")
+
+
+class _OctoBedPushSensor(OctoBedEntity, SensorEntity):
+    """Sensor whose state is computed once per coordinator update (in _refresh), not on every read.
+    _refresh updates the one attributes dict in place; HA copies it on each state write."""
+
+    __slots__ = ()
+
+    def __init__(self, coordinator: OctoBedCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+        self._refresh()
+
+    @abstractmethod
+    def _refresh(self) -> None:
+        """Recompute _attr_native_value (and attributes) from the coordinator."""
 
-class OctoBedConnectionSensor(OctoBedEntity, SensorEntity):
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._refresh()
+        super()._handle_coordinator_update()
+
+
+class OctoBedConnectionSensor(_OctoBedPushSensor):
     """Status: connected = authenticated (correct PIN, commands accepted); otherwise disconnected, PIN not accepted, or searching."""
 
+    __slots__ = ()
+
     _attr_name = "Connection"
     _attr_unique_id = "connection"
     _attr_icon = "mdi:bluetooth-connect"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def native_value(self) -> str:
-        data = self.coordinator.data or {}
-        status = data.get("connection_status", "disconnected")
+    def _refresh(self) -> None:
+        status = self.coordinator.connection_status
         if status == "connected":
-            return "connected"
-        if status == "searching":
-            return "searching for device"
-        if status == "pin_not_accepted":
-            return "PIN not accepted"
-        return "disconnected"
-
-    @property
-    def available(self) -> bool:
-        return self.coordinator.device_address is not None
+            self._attr_native_value = "connected"
+        elif status == "searching":
+            self._attr_native_value = "searching for device"
+        elif status == "pin_not_accepted":
+            self._attr_native_value = "PIN not accepted"
+        else:
+            self._attr_native_value = "disconnected"
 
 
-class OctoBedMacAddressSensor(OctoBedEntity, SensorEntity):
+class OctoBedMacAddressSensor(_OctoBedPushSensor):
     """Sensor showing the remote's MAC address (or Not set / Discovering)."""
 
+    __slots__ = ()
+
     _attr_name = "MAC address"
     _attr_unique_id = "mac_address"
+    _always_available = True
     _attr_icon = "mdi:identifier"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def native_value(self) -> str:
-        addr = self.coordinator.device_address
-        if addr:
-            return addr
-        return "Not set"
+    def _refresh(self) -> None:
+        self._attr_native_value = self.coordinator.device_address or _NOT_SET
+        self._attr_extra_state_attributes["device_name"] = self.coordinator.device_name
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str]:
-        return {
-            "device_name": self.coordinator.device_name,
-        }
-
-    @property
-    def available(self) -> bool:
-        return True
 
+class OctoBedPositionSensor(OctoBedEntity, SensorEntity):
+    """Head or feet position 0-100%% (for dashboards and automations)."""
 
-class OctoBedHeadPositionSensor(OctoBedEntity, SensorEntity):
-    """Head position 0-100%% (for dashboards and automations)."""
+    __slots__ = ("_get_position",)
 
-    _attr_name = "Head position"
-    _attr_unique_id = "head_position"
+    _always_available = True
     _attr_icon = "mdi:angle-acute"
     _attr_native_unit_of_measurement = "%"
     _attr_suggested_display_precision = 1
 
-    @property
-    def native_value(self) -> float:
-        return round(self.coordinator.head_position, 1)
-
-    @property
-    def available(self) -> bool:
-        return True
-
-
-class OctoBedFeetPositionSensor(OctoBedEntity, SensorEntity):
-    """Feet position 0-100%% (for dashboards and automations)."""
-
-    _attr_name = "Feet position"
-    _attr_unique_id = "feet_position"
-    _attr_icon = "mdi:angle-acute"
-    _attr_native_unit_of_measurement = "%"
-    _attr_suggested_display_precision = 1
+    def __init__(
+        self,
+        coordinator: OctoBedCoordinator,
+        entry: ConfigEntry,
+        axis: Literal["head", "feet"],
+    ) -> None:
+        self._attr_name = f"{axis.capitalize()} position"
+        # Set before super().__init__ so the base class scopes it to the config entry
+        self._attr_unique_id = f"{axis}_position"
+        super().__init__(coordinator, entry)
+        self._get_position = getattr(OctoBedCoordinator, f"{axis}_position").fget
 
     @property
     def native_value(self) -> float:
-        return round(self.coordinator.feet_position, 1)
-
-    @property
-    def available(self) -> bool:
-        return True
+        return round(self._get_position(self.coordinator), 1)
 
 
 class OctoBedCalibrationElapsedSensor(OctoBedEntity, SensorEntity):
     """Elapsed seconds during calibration (1, 2, 3, 4...). Shows — when not calibrating."""
 
+    __slots__ = ()
+
     _attr_name = "Calibration elapsed"
     _attr_unique_id = "calibration_elapsed"
+    _always_available = True
     _attr_icon = "mdi:timer-outline"
 
     @property
@@ -131,24 +140,22 @@ class OctoBedCalibrationElapsedSensor(OctoBedEntity, SensorEntity):
             attrs["elapsed_formatted"] = data.get("calibration_elapsed_formatted", "0:00")
         return attrs
 
-    @property
-    def available(self) -> bool:
-        return True
 
-
-class OctoBedBleStatusSensor(OctoBedEntity, SensorEntity):
+class OctoBedBleStatusSensor(_OctoBedPushSensor):
     """Like ESPHome: shows device name and whether we are authenticated (correct PIN, commands accepted)."""
 
+    __slots__ = ()
+
     _attr_name = "BLE status"
     _attr_unique_id = "ble_status"
+    _always_available = True
     _attr_icon = "mdi:bluetooth-settings"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def native_value(self) -> str:
+    def _refresh(self) -> None:
         name = self.coordinator.device_name
-        data = self.coordinator.data or {}
-        conn_status = data.get("connection_status", "disconnected")
+        data = self.coordinator.data
+        conn_status = self.coordinator.connection_status
         if conn_status == "connected":
             status = "Connected"
         elif conn_status == "pin_not_accepted":
@@ -157,32 +164,22 @@ class OctoBedBleStatusSensor(OctoBedEntity, SensorEntity):
             status = "Searching"
         else:
             status = "Disconnected"
-        value = f"{name} ({status})"
         addr = self.coordinator.device_address
         if addr:
-            value += f" [MAC: {addr}]"
-        return value
-
-    @property
-    def extra_state_attributes(self) -> dict[str, str | bool | int]:
-        data = self.coordinator.data or {}
-        attrs: dict[str, str | bool | int] = {
-            "device_name": self.coordinator.device_name,
-            "mac_address": self.coordinator.device_address or "Not set",
-            "connected": data.get("connected", False),
-            "connection_status": data.get("connection_status", "disconnected"),
-        }
-        if data.get("last_device_notification"):
-            attrs["last_device_notification"] = data["last_device_notification"]
-        if data.get("last_test_command"):
-            attrs["last_test_command"] = data["last_test_command"]
-        if data.get("last_test_set_id"):
-            attrs["last_test_set_id"] = data["last_test_set_id"]
-        return attrs
-
-    @property
-    def available(self) -> bool:
-        return True
+            self._attr_native_value = f"{name} ({status}) [MAC: {addr}]"
+        else:
+            self._attr_native_value = f"{name} ({status})"
+        attrs = self._attr_extra_state_attributes
+        attrs["device_name"] = name
+        attrs["mac_address"] = addr or _NOT_SET
+        attrs["connected"] = self.coordinator.is_connected
+        attrs["connection_status"] = conn_status
+        for key in _OPTIONAL_STATUS_KEYS:
+            value = data.get(key) if data else None
+            if value:
+                attrs[key] = value
+            else:
+                attrs.pop(key, None)
 
 
 async def async_setup_entry(
@@ -196,7 +193,7 @@ async def async_setup_entry(
         OctoBedConnectionSensor(coordinator, entry),
         OctoBedMacAddressSensor(coordinator, entry),
         OctoBedBleStatusSensor(coordinator, entry),
-        OctoBedHeadPositionSensor(coordinator, entry),
-        OctoBedFeetPositionSensor(coordinator, entry),
+        OctoBedPositionSensor(coordinator, entry, "head"),
+        OctoBedPositionSensor(coordinator, entry, "feet"),
         OctoBedCalibrationElapsedSensor(coordinator, entry),
     ])
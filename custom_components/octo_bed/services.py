@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
+from typing import Any
 
 import voluptuous as vol
 
@@ -28,16 +30,38 @@ ATTR_DEVICE_ID = "device_id"
 ATTR_COMMAND_FAMILY = "command_family"
 ATTR_OPCODE = "opcode"
 
+
+def _position(value: Any) -> float:
+    """Validate and coerce a 0-100 position for the position services."""
+    try:
+        position = float(value)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid(f"expected a number, got {value!r}") from err
+    if not 0.0 <= position <= 100.0:
+        raise vol.Invalid(f"position must be between 0 and 100, got {position}")
+    return position
+
+
+def _device_id(value: Any) -> str | None:
+    """Accept a device id string, or the {"device_id": ...} dict the UI device selector sends."""
+    if isinstance(value, dict):
+        value = value.get("device_id")
+    if value is None or isinstance(value, str):
+        return value
+    raise vol.Invalid(f"expected a device id, got {value!r}")
+
+
 SET_POSITION_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_POSITION): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Required(ATTR_POSITION): _position,
+        vol.Optional(ATTR_DEVICE_ID): _device_id,
     }
 )
 
 SET_PIN_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_PIN): vol.All(str, vol.Length(min=4, max=4), vol.Match(r"^\d{4}$")),
-        vol.Optional(ATTR_DEVICE_ID): str,
+        vol.Optional(ATTR_DEVICE_ID): _device_id,
     }
 )
 
@@ -45,53 +69,73 @@ SEND_SYSTEM_COMMAND_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_COMMAND_FAMILY): vol.In(("short", "72")),
         vol.Required(ATTR_OPCODE): vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
-        vol.Optional(ATTR_DEVICE_ID): str,
+        vol.Optional(ATTR_DEVICE_ID): _device_id,
     }
 )
 
 
+# device_id -> coordinator, so repeated service calls skip the device registry.
+# Entries are verified against hass.data on read and dropped on unload.
+_COORD_CACHE: dict[str, OctoBedCoordinator] = {}
+_first_coord: OctoBedCoordinator | None = None
+
+
+def _is_loaded(domain_data: dict[str, Any], coord: OctoBedCoordinator | None) -> bool:
+    """Return True if coord is still the loaded coordinator for its entry."""
+    return coord is not None and domain_data.get(coord._entry.entry_id) is coord
+
+
 def _get_coordinator(hass: HomeAssistant, device_id: str | None = None) -> OctoBedCoordinator | None:
     """Return coordinator for the given device_id, or the first (single bed) if device_id is None."""
+    global _first_coord
     domain_data = hass.data.get(DOMAIN) or {}
     if device_id:
+        coord = _COORD_CACHE.get(device_id)
+        if _is_loaded(domain_data, coord):
+            return coord
         dev_reg = dr.async_get(hass)
         device = dev_reg.async_get(device_id)
         if not device or not device.config_entries:
             return None
-        entry_id = next(iter(device.config_entries))
+        # primary_config_entry is only set on newer HA versions
+        entry_id = getattr(device, "primary_config_entry", None) or next(iter(device.config_entries))
         coord = domain_data.get(entry_id)
-        return coord if isinstance(coord, OctoBedCoordinator) else None
+        if not isinstance(coord, OctoBedCoordinator):
+            return None
+        _COORD_CACHE[device_id] = coord
+        return coord
+    if _is_loaded(domain_data, _first_coord):
+        return _first_coord
     for coord in domain_data.values():
         if isinstance(coord, OctoBedCoordinator):
+            _first_coord = coord
             return coord
     return None
 
 
-async def async_set_head_position(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Set head position to 0-100% (like cover set_position)."""
-    coordinator = _get_coordinator(hass)
-    if not coordinator:
-        _LOGGER.warning("Octo Bed: no device found for service call")
-        return
-    position = call.data[ATTR_POSITION]
-    await coordinator.async_set_head_position(position)
+def async_forget_coordinator(coordinator: OctoBedCoordinator) -> None:
+    """Drop cached service lookups for a coordinator being unloaded."""
+    global _first_coord
+    for device_id in [d for d, c in _COORD_CACHE.items() if c is coordinator]:
+        del _COORD_CACHE[device_id]
+    if _first_coord is coordinator:
+        _first_coord = None
 
 
-async def async_set_feet_position(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Set feet position to 0-100% (like cover set_position)."""
-    coordinator = _get_coordinator(hass)
+async def async_set_position(hass: HomeAssistant, call: ServiceCall, *, section: str) -> None:
+    """Set head or feet position to 0-100% (like cover set_position)."""
+    device_id = call.data.get(ATTR_DEVICE_ID)
+    coordinator = _get_coordinator(hass, device_id)
     if not coordinator:
-        _LOGGER.warning("Octo Bed: no device found for service call")
+        _LOGGER.warning("Octo Bed: no device found for service call (check device_id)")
         return
     position = call.data[ATTR_POSITION]
-    await coordinator.async_set_feet_position(position)
+    await getattr(coordinator, f"async_set_{section}_position")(position)
 
 
 async def async_set_pin(hass: HomeAssistant, call: ServiceCall) -> None:
     """Set or change the PIN on the device (e.g. after hard reset). Sends 40 20 3c... and updates config."""
     device_id = call.data.get(ATTR_DEVICE_ID)
-    if isinstance(device_id, dict):
-        device_id = device_id.get("device_id")
     coordinator = _get_coordinator(hass, device_id)
     if not coordinator:
         _LOGGER.warning("Octo Bed: no device found for set_pin (check device_id)")
@@ -109,14 +153,12 @@ async def async_set_pin(hass: HomeAssistant, call: ServiceCall) -> None:
 async def async_send_system_command(hass: HomeAssistant, call: ServiceCall) -> None:
     """Send a system command by family and opcode (for testing; check BLE status for response)."""
     device_id = call.data.get(ATTR_DEVICE_ID)
-    if isinstance(device_id, dict):
-        device_id = device_id.get("device_id")
     coordinator = _get_coordinator(hass, device_id)
     if not coordinator:
         _LOGGER.warning("Octo Bed: no device found for send_system_command (check device_id)")
         return
     family = call.data[ATTR_COMMAND_FAMILY]
-    opcode = int(call.data[ATTR_OPCODE]) & 0xFF
+    opcode = call.data[ATTR_OPCODE]
     ok = await coordinator.async_send_system_command(family, opcode)
     if ok:
         _LOGGER.info("Octo Bed: sent system command %s opcode 0x%02X", family, opcode)
@@ -124,45 +166,20 @@ async def async_send_system_command(hass: HomeAssistant, call: ServiceCall) -> N
         _LOGGER.warning("Octo Bed: send_system_command failed (device not available)")
 
 
+# (service, handler, schema); handlers take (hass, call) and are bound to hass on registration
+_SERVICES = (
+    (SERVICE_SET_HEAD_POSITION, partial(async_set_position, section="head"), SET_POSITION_SCHEMA),
+    (SERVICE_SET_FEET_POSITION, partial(async_set_position, section="feet"), SET_POSITION_SCHEMA),
+    (SERVICE_SET_BED_HEAD_POSITION, partial(async_set_position, section="head"), SET_POSITION_SCHEMA),
+    (SERVICE_SET_BED_FEET_POSITION, partial(async_set_position, section="feet"), SET_POSITION_SCHEMA),
+    (SERVICE_SET_PIN, async_set_pin, SET_PIN_SCHEMA),
+    (SERVICE_SEND_SYSTEM_COMMAND, async_send_system_command, SEND_SYSTEM_COMMAND_SCHEMA),
+)
+
+
 def async_setup_services(hass: HomeAssistant) -> None:
     """Register Octo Bed services."""
-    if hass.services.has_service(DOMAIN, SERVICE_SET_HEAD_POSITION):
+    if hass.services.has_service(DOMAIN, _SERVICES[0][0]):
         return
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_HEAD_POSITION,
-        async_set_head_position,
-        schema=SET_POSITION_SCHEMA,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_FEET_POSITION,
-        async_set_feet_position,
-        schema=SET_POSITION_SCHEMA,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_BED_HEAD_POSITION,
-        async_set_head_position,
-        schema=SET_POSITION_SCHEMA,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_BED_FEET_POSITION,
-        async_set_feet_position,
-        schema=SET_POSITION_SCHEMA,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_PIN,
-        async_set_pin,
-        schema=SET_PIN_SCHEMA,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SEND_SYSTEM_COMMAND,
-        async_send_system_command,
-        schema=SEND_SYSTEM_COMMAND_SCHEMA,
-    )
-
-
+    for service, handler, schema in _SERVICES:
+        hass.services.async_register(DOMAIN, service, partial(handler, hass), schema=schema)
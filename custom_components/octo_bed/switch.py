@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -27,192 +26,59 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class OctoBedMovementSwitch(OctoBedEntity, SwitchEntity):
-    """Base switch that runs movement while on (single BLE connection for smooth movement)."""
+    """Base switch that runs movement while on (coordinator runs one shared movement loop)."""
 
-    _cal_key = "head"  # "head" or "feet"
-    _direction_up = True
-    _task: asyncio.Task | None = None
-    _stop_event: asyncio.Event | None = None
-    _movement_start_time: float = 0.0
-
-    def _get_command(self) -> bytes:
-        if self._cal_key == "head":
-            return CMD_HEAD_UP if self._direction_up else CMD_HEAD_DOWN
-        return CMD_FEET_UP if self._direction_up else CMD_FEET_DOWN
+    _cmd: bytes  # set by each subclass
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        if self._task and not self._task.done():
-            return
-        if self._stop_event is None:
-            self._stop_event = asyncio.Event()
-        self._stop_event.clear()
-        self._movement_start_time = self.hass.loop.time()
-        self._task = asyncio.create_task(
-            self.coordinator.async_run_movement_loop(
-                self._get_command(),
-                self._stop_event.is_set,
-            )
-        )
-        self._task.add_done_callback(lambda _: self.async_write_ha_state())
-        self.async_write_ha_state()
+        await self.coordinator.request_movement(self._cmd)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        if self._stop_event:
-            self._stop_event.set()
-        if self._task:
-            result = None
-            try:
-                result = await asyncio.wait_for(self._task, timeout=5.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                self._task.cancel()
-                try:
-                    await self._task
-                except asyncio.CancelledError:
-                    pass
-            self._task = None
-            duration = self.hass.loop.time() - self._movement_start_time
-            hit_limit = result[1] if result is not None and len(result) == 2 else False
-            if duration > 0.1 and not hit_limit:
-                self.coordinator.update_position_after_switch_movement(
-                    self._get_command(), duration
-                )
-        self.async_write_ha_state()
+        await self.coordinator.stop_movement(self._cmd)
 
     @property
     def is_on(self) -> bool:
-        return self._task is not None and not self._task.done()
+        return self.coordinator.active_cmd == self._cmd
 
 
 class OctoBedHeadUpSwitch(OctoBedMovementSwitch):
     _attr_name = "Head Up"
     _attr_unique_id = "head_up"
-    _cal_key = "head"
-    _direction_up = True
+    _cmd = CMD_HEAD_UP
 
 
 class OctoBedHeadDownSwitch(OctoBedMovementSwitch):
     _attr_name = "Head Down"
     _attr_unique_id = "head_down"
-    _cal_key = "head"
-    _direction_up = False
+    _cmd = CMD_HEAD_DOWN
 
 
 class OctoBedFeetUpSwitch(OctoBedMovementSwitch):
     _attr_name = "Feet Up"
     _attr_unique_id = "feet_up"
-    _cal_key = "feet"
-    _direction_up = True
+    _cmd = CMD_FEET_UP
 
 
 class OctoBedFeetDownSwitch(OctoBedMovementSwitch):
     _attr_name = "Feet Down"
     _attr_unique_id = "feet_down"
-    _cal_key = "feet"
-    _direction_up = False
+    _cmd = CMD_FEET_DOWN
 
 
-class OctoBedBothUpSwitch(OctoBedEntity, SwitchEntity):
+class OctoBedBothUpSwitch(OctoBedMovementSwitch):
     """Both sections up (hold to move)."""
 
     _attr_name = "Both Up"
     _attr_unique_id = "both_up"
-    _task: asyncio.Task | None = None
-    _stop_event: asyncio.Event | None = None
-    _movement_start_time: float = 0.0
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        if self._task and not self._task.done():
-            return
-        if self._stop_event is None:
-            self._stop_event = asyncio.Event()
-        self._stop_event.clear()
-        self._movement_start_time = self.hass.loop.time()
-        self._task = asyncio.create_task(
-            self.coordinator.async_run_movement_loop(
-                CMD_BOTH_UP,
-                self._stop_event.is_set,
-            )
-        )
-        self._task.add_done_callback(lambda _: self.async_write_ha_state())
-        self.async_write_ha_state()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        if self._stop_event:
-            self._stop_event.set()
-        if self._task:
-            result = None
-            try:
-                result = await asyncio.wait_for(self._task, timeout=5.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                self._task.cancel()
-                try:
-                    await self._task
-                except asyncio.CancelledError:
-                    pass
-            self._task = None
-            duration = self.hass.loop.time() - self._movement_start_time
-            hit_limit = result[1] if result is not None and len(result) == 2 else False
-            if duration > 0.1 and not hit_limit:
-                self.coordinator.update_position_after_switch_movement(
-                    CMD_BOTH_UP, duration
-                )
-        self.async_write_ha_state()
-
-    @property
-    def is_on(self) -> bool:
-        return self._task is not None and not self._task.done()
+    _cmd = CMD_BOTH_UP
 
 
-class OctoBedBothDownSwitch(OctoBedEntity, SwitchEntity):
+class OctoBedBothDownSwitch(OctoBedMovementSwitch):
     """Both sections down (hold to move)."""
 
     _attr_name = "Both Down"
     _attr_unique_id = "both_down"
-    _task: asyncio.Task | None = None
-    _stop_event: asyncio.Event | None = None
-    _movement_start_time: float = 0.0
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        if self._task and not self._task.done():
-            return
-        if self._stop_event is None:
-            self._stop_event = asyncio.Event()
-        self._stop_event.clear()
-        self._movement_start_time = self.hass.loop.time()
-        self._task = asyncio.create_task(
-            self.coordinator.async_run_movement_loop(
-                CMD_BOTH_DOWN,
-                self._stop_event.is_set,
-            )
-        )
-        self._task.add_done_callback(lambda _: self.async_write_ha_state())
-        self.async_write_ha_state()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        if self._stop_event:
-            self._stop_event.set()
-        if self._task:
-            result = None
-            try:
-                result = await asyncio.wait_for(self._task, timeout=5.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                self._task.cancel()
-                try:
-                    await self._task
-                except asyncio.CancelledError:
-                    pass
-            self._task = None
-            duration = self.hass.loop.time() - self._movement_start_time
-            hit_limit = result[1] if result is not None and len(result) == 2 else False
-            if duration > 0.1 and not hit_limit:
-                self.coordinator.update_position_after_switch_movement(
-                    CMD_BOTH_DOWN, duration
-                )
-        self.async_write_ha_state()
-
-    @property
-    def is_on(self) -> bool:
-        return self._task is not None and not self._task.done()
+    _cmd = CMD_BOTH_DOWN
 
 
 async def async_setup_entry(
@@ -222,11 +88,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Octo Bed movement switches."""
     coordinator: OctoBedCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([
-        OctoBedHeadUpSwitch(coordinator, entry),
-        OctoBedHeadDownSwitch(coordinator, entry),
-        OctoBedFeetUpSwitch(coordinator, entry),
-        OctoBedFeetDownSwitch(coordinator, entry),
-        OctoBedBothUpSwitch(coordinator, entry),
-        OctoBedBothDownSwitch(coordinator, entry),
-    ])
+    async_add_entities(
+        cls(coordinator, entry)
+        for cls in (
+            OctoBedHeadUpSwitch,
+            OctoBedHeadDownSwitch,
+            OctoBedFeetUpSwitch,
+            OctoBedFeetDownSwitch,
+            OctoBedBothUpSwitch,
+            OctoBedBothDownSwitch,
+        )
+    )
@@ -8,8 +8,15 @@ wait; wrong PIN should cause disconnect, correct PIN should keep connection.
 """
 
 import asyncio
+import functools
 import sys
 
+try:
+    from bleak import BleakClient
+except ImportError:
+    print("Install bleak: pip install bleak")
+    sys.exit(1)
+
 # Protocol constants (must match custom_components/octo_bed/const.py)
 BLE_CHAR_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
 KEEP_ALIVE_PREFIX = bytes([0x40, 0x20, 0x43, 0x00, 0x04, 0x00])
@@ -21,35 +28,51 @@ WAIT_AFTER_KEEPALIVE = 5.0
 CONNECT_TIMEOUT = 15.0
 
 
+# ASCII '0'-'9' -> 0-9; any other byte -> 0
+_ASCII_TO_DIGIT = bytes(i - 0x30 if 0x30 <= i <= 0x39 else 0 for i in range(256))
+
+
+@functools.lru_cache(maxsize=16)
 def make_keep_alive(pin: str) -> bytes:
     pin = (pin or "0000").strip()[:4].ljust(4, "0")
-    digits = bytes([ord(c) - ord("0") for c in pin])
-    return KEEP_ALIVE_PREFIX + digits + KEEP_ALIVE_SUFFIX
+    return KEEP_ALIVE_PREFIX + pin.encode("ascii", "replace").translate(_ASCII_TO_DIGIT) + KEEP_ALIVE_SUFFIX
 
 
-async def test_wrong_pin(address: str) -> tuple[bool, bool]:
-    """(validates_pin, connected). If not connected, validates_pin is meaningless."""
+# Packets for fixed PINs are built once at import; add new constant packets here the same way
+_KEEP_ALIVE_WRONG: bytes = make_keep_alive(WRONG_PIN)
+
+
+async def _ensure_connected(client: BleakClient, disconnected: asyncio.Event) -> None:
+    """Connect unless still connected from the previous test (saves a scan + GATT discovery)."""
+    if client.is_connected:
+        print("  Reusing connection.")
+        return
+    disconnected.clear()
+    await client.connect()
+    print("  Connected.")
+
+
+async def _disconnects_within(client: BleakClient, disconnected: asyncio.Event, timeout: float) -> bool:
+    """Wait up to timeout for the device to disconnect; returns as soon as it does. True if disconnected."""
     try:
-        from bleak import BleakClient
-    except ImportError:
-        print("Install bleak: pip install bleak")
-        sys.exit(1)
+        await asyncio.wait_for(disconnected.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    return not client.is_connected
+
 
+async def test_wrong_pin(client: BleakClient, disconnected: asyncio.Event) -> tuple[bool, bool]:
+    """(validates_pin, connected). If not connected, validates_pin is meaningless."""
     print(f"\n--- Test 1: Wrong PIN ({WRONG_PIN}) ---")
-    print("Connect, send keep-alive with wrong PIN, wait 5s...")
-    client = BleakClient(address, timeout=CONNECT_TIMEOUT)
+    print("Connect, send keep-alive with wrong PIN, wait up to 5s for a disconnect...")
     try:
-        await client.connect()
-        print("  Connected.")
-        keep_alive = make_keep_alive(WRONG_PIN)
+        await _ensure_connected(client, disconnected)
         try:
-            await client.write_gatt_char(BLE_CHAR_UUID, keep_alive, response=False)
+            await client.write_gatt_char(BLE_CHAR_UUID, _KEEP_ALIVE_WRONG, response=False)
         except Exception as e:
             print(f"  Write failed (device may have rejected): {e}")
             return (True, True)  # treat as "validates PIN"
-        await asyncio.sleep(WAIT_AFTER_KEEPALIVE)
-        still_connected = client.is_connected
-        if still_connected:
+        if not await _disconnects_within(client, disconnected, WAIT_AFTER_KEEPALIVE):
             print("  Device stayed connected → does NOT validate PIN (e.g. RC2 remote).")
             return (False, True)
         print("  Device disconnected → validates PIN (expected for bed base).")
@@ -57,33 +80,21 @@ async def test_wrong_pin(address: str) -> tuple[bool, bool]:
     except Exception as e:
         print(f"  Error: {e}")
         return (False, False)  # did not connect
-    finally:
-        if client.is_connected:
-            await client.disconnect()
 
 
-async def test_correct_pin(address: str, pin: str) -> tuple[bool, bool]:
+async def test_correct_pin(client: BleakClient, disconnected: asyncio.Event, pin: str) -> tuple[bool, bool]:
     """(pin_accepted, connected). If not connected, pin_accepted is meaningless."""
-    try:
-        from bleak import BleakClient
-    except ImportError:
-        print("Install bleak: pip install bleak")
-        sys.exit(1)
-
     print(f"\n--- Test 2: Correct PIN ({pin}) ---")
-    print("Connect, send keep-alive with PIN, wait 5s, send CMD_STOP, wait 1s...")
-    client = BleakClient(address, timeout=CONNECT_TIMEOUT)
+    print("Connect if needed, send keep-alive with PIN, wait 5s, send CMD_STOP, wait 1s...")
     try:
-        await client.connect()
-        print("  Connected.")
+        await _ensure_connected(client, disconnected)
         keep_alive = make_keep_alive(pin)
         try:
             await client.write_gatt_char(BLE_CHAR_UUID, keep_alive, response=False)
         except Exception as e:
             print(f"  Keep-alive write failed: {e}")
             return (False, True)
-        await asyncio.sleep(WAIT_AFTER_KEEPALIVE)
-        if not client.is_connected:
+        if await _disconnects_within(client, disconnected, WAIT_AFTER_KEEPALIVE):
             print("  Device disconnected after keep-alive → wrong PIN or not bed base.")
             return (False, True)
         try:
@@ -91,8 +102,7 @@ async def test_correct_pin(address: str, pin: str) -> tuple[bool, bool]:
         except Exception as e:
             print(f"  CMD_STOP failed: {e}")
             return (False, True)
-        await asyncio.sleep(1.0)
-        if not client.is_connected:
+        if await _disconnects_within(client, disconnected, 1.0):
             print("  Device disconnected after CMD_STOP.")
             return (False, True)
         print("  Stayed connected and accepted command → PIN accepted.")
@@ -100,9 +110,6 @@ async def test_correct_pin(address: str, pin: str) -> tuple[bool, bool]:
     except Exception as e:
         print(f"  Error: {e}")
         return (False, False)  # did not connect
-    finally:
-        if client.is_connected:
-            await client.disconnect()
 
 
 async def main():
@@ -122,8 +129,19 @@ async def main():
     print(f"Octo Bed BLE PIN test")
     print(f"Address: {address}  PIN: {pin}")
 
-    validates, connected1 = await test_wrong_pin(address)
-    ok, connected2 = await test_correct_pin(address, pin)
+    # One client for both tests: test 2 reuses the connection unless the wrong PIN dropped it
+    disconnected = asyncio.Event()
+    client = BleakClient(
+        address,
+        timeout=CONNECT_TIMEOUT,
+        disconnected_callback=lambda _client: disconnected.set(),
+    )
+    try:
+        validates, connected1 = await test_wrong_pin(client, disconnected)
+        ok, connected2 = await test_correct_pin(client, disconnected, pin)
+    finally:
+        if client.is_connected:
+            await client.disconnect()
 
     print("\n--- Summary ---")
     if not connected1 and not connected2: